@@ -5,7 +5,9 @@
 «Денежный поток». Пользователь может вводить свои доходы, расходы,
 активы и обязательства. Итоговые значения (общий доход, пассивный
 доход, общие расходы, денежный поток, чистые активы) рассчитываются
-автоматически при изменении любой из граф.
+автоматически после ввода значения в любую из граф (при переходе к
+другому полю или нажатии Enter). Поля принимают только числа: прочие
+символы отбрасываются ещё на уровне виджета.
 
 Библиотека Tkinter поставляется в стандартной поставке Python, что
 позволяет запускать приложение без дополнительных зависимостей. Для
@@ -19,7 +21,9 @@
 
 from __future__ import annotations
 
+import re
 import tkinter as tk
+from functools import lru_cache
 from tkinter import ttk
 
 from .models import FinancialStatement
@@ -66,6 +70,41 @@ LIABILITY_CATEGORIES = {
     'other_liabilities': 'Прочие обязательства',
 }
 
+# Допустимое содержимое поля ввода: необязательный минус, цифры и не более
+# одного десятичного разделителя. Шаблон совпадает и с незавершённым вводом
+# («», «-», «,»), чтобы пользователь мог набрать число посимвольно.
+_NUMERIC_INPUT = re.compile(r'-?[0-9]*[.,]?[0-9]*')
+
+# Таблица замены для денежного формата: разделитель разрядов «,» становится
+# пробелом, десятичная точка – запятой. Обе замены выполняются за один проход
+_MONEY_TRANS = str.maketrans({',': ' ', '.': ','})
+
+
+def _format_money(number: float) -> str:
+    """Отформатировать сумму с двумя знаками после запятой и разделением
+    разрядов пробелом, например ``1 234,50``."""
+    return f"{number:,.2f}".translate(_MONEY_TRANS)
+
+
+# Начальный текст итоговых меток: форма открывается с нулевыми суммами
+_ZERO_MONEY = _format_money(0.0)
+
+
+@lru_cache(maxsize=512)
+def _parse_value_cached(value: str) -> float:
+    """Преобразовать строковое значение в float.
+
+    Пустые строки и некорректные данные интерпретируются как 0. Результат
+    кэшируется: в полях формы часто повторяются одни и те же короткие
+    строки («0», «100», «1000»).
+    """
+    try:
+        # Заменяем запятую на точку для поддержки российской нотации
+        cleaned = value.replace(',', '.') if value else '0'
+        return float(cleaned)
+    except ValueError:
+        return 0.0
+
 
 class CashflowApp(tk.Tk):
     """Основное окно приложения.
@@ -82,158 +121,197 @@ class CashflowApp(tk.Tk):
         # Модель финансового отчёта, на основе которой выполняются расчёты
         self.statement = FinancialStatement()
 
-        # Словари для хранения переменных Tkinter
-        self.vars_income: dict[str, tk.StringVar] = {}
-        self.vars_expenses: dict[str, tk.StringVar] = {}
-        self.vars_assets: dict[str, tk.StringVar] = {}
-        self.vars_liabilities: dict[str, tk.StringVar] = {}
-
-        # Создаём интерфейс
+        # Словари полей ввода по категориям. Переменные Tkinter (StringVar)
+        # не используются: значение читается из поля только при завершении ввода
+        self.entries_income: dict[str, ttk.Entry] = {}
+        self.entries_expenses: dict[str, ttk.Entry] = {}
+        self.entries_assets: dict[str, ttk.Entry] = {}
+        self.entries_liabilities: dict[str, ttk.Entry] = {}
+
+        # Методы модели, обновляющие значение в каждом из разделов формы
+        self._updaters = {
+            'income': self.statement.update_income,
+            'expense': self.statement.update_expense,
+            'asset': self.statement.update_asset,
+            'liability': self.statement.update_liability,
+        }
+
+        # Флаг отложенного пересчёта: серия изменений полей сводится
+        # к одному обновлению итогов в момент простоя цикла событий
+        self._update_pending = False
+
+        # Последний выведенный текст каждой итоговой метки: позволяет не
+        # обращаться к Tk, если значение не изменилось
+        self._last_text: dict[ttk.Label, str] = {}
+
+        # Создаём интерфейс. Итоговые метки сразу получают нулевые значения,
+        # поэтому начальный расчёт не требуется
         self._create_widgets()
-        # Выполним начальный расчёт, чтобы установить начальные значения
-        self.update_summary()
 
     def _create_widgets(self) -> None:
         """Создание и размещение всех виджетов GUI."""
-        # Используем ttk для более современного внешнего вида
-        # Разделим форму на две секции: верхняя – отчёт о доходах/расходах,
-        # нижняя – баланс (активы/обязательства)
-        income_frame = ttk.LabelFrame(self, text="Доходы и Расходы")
-        income_frame.grid(row=0, column=0, padx=10, pady=10, sticky="nsew")
-
-        # Подразделы
-        income_subframe = ttk.LabelFrame(income_frame, text="Доходы")
-        expense_subframe = ttk.LabelFrame(income_frame, text="Расходы")
-        income_subframe.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        expense_subframe.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
-
-        # Заполняем доходы
-        for i, (key, label) in enumerate(INCOME_CATEGORIES.items()):
-            ttk.Label(income_subframe, text=label + ":").grid(row=i, column=0, sticky="w", padx=2, pady=2)
-            var = tk.StringVar(value="0")
-            # Создаём callback, который будет обновлять модель при изменении значения
-            var.trace_add('write', lambda *args, key=key, var=var: self.on_income_change(key, var))
-            entry = ttk.Entry(income_subframe, textvariable=var, width=15)
-            entry.grid(row=i, column=1, padx=2, pady=2)
-            self.vars_income[key] = var
-
-        # Заполняем расходы
-        for i, (key, label) in enumerate(EXPENSE_CATEGORIES.items()):
-            ttk.Label(expense_subframe, text=label + ":").grid(row=i, column=0, sticky="w", padx=2, pady=2)
-            var = tk.StringVar(value="0")
-            var.trace_add('write', lambda *args, key=key, var=var: self.on_expense_change(key, var))
-            entry = ttk.Entry(expense_subframe, textvariable=var, width=15)
-            entry.grid(row=i, column=1, padx=2, pady=2)
-            self.vars_expenses[key] = var
+        # Используем ttk для более современного внешнего вида.
+        # Разделы формы размещены на вкладках: содержимое вкладки создаётся
+        # только при первом её открытии, что сокращает время запуска
+        self.notebook = ttk.Notebook(self)
+        self.notebook.grid(row=0, column=0, columnspan=2, padx=10, pady=10, sticky="nsew")
+
+        # Проверка ввода выполняется Tk при каждом нажатии клавиши; %P –
+        # значение поля, которое получится, если изменение будет принято
+        self._vcmd = (self.register(self._validate_numeric), '%P')
+
+        # Пересчёт выполняется, когда пользователь завершил ввод в поле.
+        # Обработчик привязан один раз к классу TEntry, а не к каждому полю
+        self.bind_class('TEntry', '<FocusOut>', self.on_change, add='+')
+        self.bind_class('TEntry', '<Return>', self.on_change, add='+')
+
+        # Вкладка -> (раздел модели, категории, словарь полей ввода)
+        self._tab_sections: dict[str, tuple[str, dict[str, str], dict[str, ttk.Entry]]] = {}
+        self._built_tabs: set[str] = set()
+        for title, section, categories, entries in (
+            ("Доходы", 'income', INCOME_CATEGORIES, self.entries_income),
+            ("Расходы", 'expense', EXPENSE_CATEGORIES, self.entries_expenses),
+            ("Активы", 'asset', ASSET_CATEGORIES, self.entries_assets),
+            ("Обязательства", 'liability', LIABILITY_CATEGORIES, self.entries_liabilities),
+        ):
+            tab = ttk.Frame(self.notebook, padding=5)
+            self.notebook.add(tab, text=title)
+            self._tab_sections[str(tab)] = (section, categories, entries)
+
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_changed)
+        # Первая вкладка видна сразу, поэтому создаём её содержимое заранее
+        self._ensure_tab_built(self.notebook.select())
 
         # Итоговые значения для отчёта о доходах/расходах
+        income_frame = ttk.LabelFrame(self, text="Доходы и Расходы")
+        income_frame.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
         summary_frame = ttk.Frame(income_frame)
-        summary_frame.grid(row=1, column=0, columnspan=2, pady=5, sticky="nsew")
+        summary_frame.grid(row=0, column=0, pady=5, sticky="nsew")
         ttk.Label(summary_frame, text="Общий доход:").grid(row=0, column=0, sticky="w", padx=2)
-        self.label_total_income = ttk.Label(summary_frame, text="0")
+        self.label_total_income = ttk.Label(summary_frame, text=_ZERO_MONEY)
         self.label_total_income.grid(row=0, column=1, sticky="e", padx=2)
 
         ttk.Label(summary_frame, text="Пассивный доход:").grid(row=1, column=0, sticky="w", padx=2)
-        self.label_passive_income = ttk.Label(summary_frame, text="0")
+        self.label_passive_income = ttk.Label(summary_frame, text=_ZERO_MONEY)
         self.label_passive_income.grid(row=1, column=1, sticky="e", padx=2)
 
         ttk.Label(summary_frame, text="Общие расходы:").grid(row=2, column=0, sticky="w", padx=2)
-        self.label_total_expenses = ttk.Label(summary_frame, text="0")
+        self.label_total_expenses = ttk.Label(summary_frame, text=_ZERO_MONEY)
         self.label_total_expenses.grid(row=2, column=1, sticky="e", padx=2)
 
         ttk.Label(summary_frame, text="Денежный поток (остаток):").grid(row=3, column=0, sticky="w", padx=2)
-        self.label_cash_flow = ttk.Label(summary_frame, text="0")
+        self.label_cash_flow = ttk.Label(summary_frame, text=_ZERO_MONEY)
         self.label_cash_flow.grid(row=3, column=1, sticky="e", padx=2)
 
-        # Теперь создаём секцию для активов/обязательств
-        balance_frame = ttk.LabelFrame(self, text="Баланс: Активы и Обязательства")
-        balance_frame.grid(row=1, column=0, padx=10, pady=5, sticky="nsew")
-
-        asset_subframe = ttk.LabelFrame(balance_frame, text="Активы")
-        liability_subframe = ttk.LabelFrame(balance_frame, text="Обязательства")
-        asset_subframe.grid(row=0, column=0, padx=5, pady=5, sticky="nsew")
-        liability_subframe.grid(row=0, column=1, padx=5, pady=5, sticky="nsew")
-
-        # Заполняем активы
-        for i, (key, label) in enumerate(ASSET_CATEGORIES.items()):
-            ttk.Label(asset_subframe, text=label + ":").grid(row=i, column=0, sticky="w", padx=2, pady=2)
-            var = tk.StringVar(value="0")
-            var.trace_add('write', lambda *args, key=key, var=var: self.on_asset_change(key, var))
-            entry = ttk.Entry(asset_subframe, textvariable=var, width=15)
-            entry.grid(row=i, column=1, padx=2, pady=2)
-            self.vars_assets[key] = var
-
-        # Заполняем обязательства
-        for i, (key, label) in enumerate(LIABILITY_CATEGORIES.items()):
-            ttk.Label(liability_subframe, text=label + ":").grid(row=i, column=0, sticky="w", padx=2, pady=2)
-            var = tk.StringVar(value="0")
-            var.trace_add('write', lambda *args, key=key, var=var: self.on_liability_change(key, var))
-            entry = ttk.Entry(liability_subframe, textvariable=var, width=15)
-            entry.grid(row=i, column=1, padx=2, pady=2)
-            self.vars_liabilities[key] = var
-
         # Итоговые значения баланса
+        balance_frame = ttk.LabelFrame(self, text="Баланс: Активы и Обязательства")
+        balance_frame.grid(row=1, column=1, padx=10, pady=5, sticky="nsew")
         balance_summary_frame = ttk.Frame(balance_frame)
-        balance_summary_frame.grid(row=1, column=0, columnspan=2, pady=5, sticky="nsew")
+        balance_summary_frame.grid(row=0, column=0, pady=5, sticky="nsew")
         ttk.Label(balance_summary_frame, text="Всего активов:").grid(row=0, column=0, sticky="w", padx=2)
-        self.label_total_assets = ttk.Label(balance_summary_frame, text="0")
+        self.label_total_assets = ttk.Label(balance_summary_frame, text=_ZERO_MONEY)
         self.label_total_assets.grid(row=0, column=1, sticky="e", padx=2)
         ttk.Label(balance_summary_frame, text="Всего обязательств:").grid(row=1, column=0, sticky="w", padx=2)
-        self.label_total_liabilities = ttk.Label(balance_summary_frame, text="0")
+        self.label_total_liabilities = ttk.Label(balance_summary_frame, text=_ZERO_MONEY)
         self.label_total_liabilities.grid(row=1, column=1, sticky="e", padx=2)
         ttk.Label(balance_summary_frame, text="Чистые активы:").grid(row=2, column=0, sticky="w", padx=2)
-        self.label_net_worth = ttk.Label(balance_summary_frame, text="0")
+        self.label_net_worth = ttk.Label(balance_summary_frame, text=_ZERO_MONEY)
         self.label_net_worth.grid(row=2, column=1, sticky="e", padx=2)
 
-    def _parse_value(self, value: str) -> float:
-        """Преобразовать строковое значение в float.
+        for label in (self.label_total_income, self.label_passive_income,
+                      self.label_total_expenses, self.label_cash_flow,
+                      self.label_total_assets, self.label_total_liabilities,
+                      self.label_net_worth):
+            self._last_text[label] = _ZERO_MONEY
+
+    def _on_tab_changed(self, event: tk.Event) -> None:
+        """Callback вызывается при переключении вкладки раздела."""
+        self._ensure_tab_built(self.notebook.select())
+
+    def _ensure_tab_built(self, tab_id: str) -> None:
+        """Создать содержимое вкладки, если оно ещё не создано."""
+        if tab_id in self._built_tabs:
+            return
+        self._built_tabs.add(tab_id)
+        section, categories, entries = self._tab_sections[tab_id]
+        self._build_section(self.nametowidget(tab_id), section, categories, entries)
+
+    def _build_section(self, parent: ttk.Frame, section: str,
+                       categories: dict[str, str], entries: dict[str, ttk.Entry]) -> None:
+        """Создать подписи и поля ввода для всех категорий раздела."""
+        for i, (key, label) in enumerate(categories.items()):
+            ttk.Label(parent, text=label + ":").grid(row=i, column=0, sticky="w", padx=2, pady=2)
+            entry = ttk.Entry(parent, width=15, validate='key', validatecommand=self._vcmd)
+            entry.insert(0, "0")
+            # Раздел и категория поля читаются общим обработчиком on_change
+            entry.section = section
+            entry.category = key
+            entry.grid(row=i, column=1, padx=2, pady=2)
+            entries[key] = entry
+
+    def _validate_numeric(self, proposed: str) -> bool:
+        """Проверить, что содержимое поля является числом или его началом.
 
-        Пустые строки и некорректные данные интерпретируются как 0.
+        Допускаются пустая строка, одиночный минус и десятичный
+        разделитель (точка или запятая), чтобы пользователь мог начать
+        ввод, например, с «-» или «,5».
         """
-        try:
-            # Заменяем запятую на точку для поддержки российской нотации
-            cleaned = value.replace(',', '.') if value else '0'
-            return float(cleaned)
-        except ValueError:
-            return 0.0
-
-    def on_income_change(self, key: str, var: tk.StringVar) -> None:
-        """Callback вызывается при изменении поля дохода."""
-        value = self._parse_value(var.get())
-        self.statement.update_income(key, value)
-        self.update_summary()
+        return _NUMERIC_INPUT.fullmatch(proposed) is not None
 
-    def on_expense_change(self, key: str, var: tk.StringVar) -> None:
-        """Callback вызывается при изменении поля расхода."""
-        value = self._parse_value(var.get())
-        self.statement.update_expense(key, value)
-        self.update_summary()
+    def on_change(self, event: tk.Event) -> None:
+        """Callback вызывается по завершении ввода в любое поле формы.
 
-    def on_asset_change(self, key: str, var: tk.StringVar) -> None:
-        """Callback вызывается при изменении поля актива."""
-        value = self._parse_value(var.get())
-        self.statement.update_asset(key, value)
-        self.update_summary()
+        Атрибут ``section`` поля определяет раздел модели (доходы, расходы,
+        активы или обязательства), ``category`` – категорию внутри раздела.
+        Поля без этих атрибутов игнорируются.
+        """
+        entry = event.widget
+        section = getattr(entry, 'section', None)
+        if section is None:
+            return
+        value = _parse_value_cached(entry.get())
+        self._updaters[section](entry.category, value)
+        self._schedule_update()
+
+    def destroy(self) -> None:
+        """Закрыть окно и освободить кэш разбора введённых значений."""
+        _parse_value_cached.cache_clear()
+        super().destroy()
+
+    def _schedule_update(self) -> None:
+        """Запланировать обновление итогов на момент простоя Tk.
+
+        Повторные вызовы до выполнения обновления игнорируются, поэтому
+        быстрый ввод нескольких символов приводит к одной перерисовке.
+        """
+        if not self._update_pending:
+            self._update_pending = True
+            self.after_idle(self._do_update)
 
-    def on_liability_change(self, key: str, var: tk.StringVar) -> None:
-        """Callback вызывается при изменении поля обязательства."""
-        value = self._parse_value(var.get())
-        self.statement.update_liability(key, value)
+    def _do_update(self) -> None:
+        """Выполнить запланированное обновление итогов."""
+        self._update_pending = False
         self.update_summary()
 
     def update_summary(self) -> None:
-        """Обновить текстовые поля итоговых значений на основе модели."""
-        # Форматируем числа с двумя десятичными знаками и разделением по пробелу
-        def fmt(number: float) -> str:
-            return f"{number:,.2f}".replace(',', ' ').replace('.', ',')
-
-        self.label_total_income.config(text=fmt(self.statement.total_income))
-        self.label_passive_income.config(text=fmt(self.statement.passive_income))
-        self.label_total_expenses.config(text=fmt(self.statement.total_expenses))
-        self.label_cash_flow.config(text=fmt(self.statement.cash_flow))
-        self.label_total_assets.config(text=fmt(self.statement.total_assets))
-        self.label_total_liabilities.config(text=fmt(self.statement.total_liabilities))
-        self.label_net_worth.config(text=fmt(self.statement.net_worth))
+        """Обновить текстовые поля итоговых значений на основе модели.
+
+        Вызывается в фазе простоя Tk, поэтому все изменённые метки
+        перерисовываются вместе, без отдельного вызова ``update_idletasks``.
+        """
+        self._set_label(self.label_total_income, _format_money(self.statement.total_income))
+        self._set_label(self.label_passive_income, _format_money(self.statement.passive_income))
+        self._set_label(self.label_total_expenses, _format_money(self.statement.total_expenses))
+        self._set_label(self.label_cash_flow, _format_money(self.statement.cash_flow))
+        self._set_label(self.label_total_assets, _format_money(self.statement.total_assets))
+        self._set_label(self.label_total_liabilities, _format_money(self.statement.total_liabilities))
+        self._set_label(self.label_net_worth, _format_money(self.statement.net_worth))
+
+    def _set_label(self, label: ttk.Label, text: str) -> None:
+        """Изменить текст метки, только если он отличается от текущего."""
+        if self._last_text.get(label) != text:
+            label.config(text=text)
+            self._last_text[label] = text
 
 
 def main() -> None:
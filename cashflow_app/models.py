@@ -7,24 +7,41 @@
 ``FinancialStatement``. Эти модели инкапсулируют данные и логику
 вычислений, что позволяет отделить бизнес‑логику от пользовательского
 интерфейса и облегчает тестирование.
+
+Все модели объявлены как ``dataclass(slots=True)``: атрибуты хранятся в
+слотах, а не в ``__dict__`` экземпляра, что ускоряет доступ к ним и
+уменьшает расход памяти. Сами суммы по категориям по-прежнему хранятся
+в словарях, так как набор категорий не фиксирован моделью.
 """
 
 from __future__ import annotations
 
+import math
 from dataclasses import dataclass, field
-from typing import Dict
+from typing import Dict, Mapping
+
+
+def _to_amount(value: float | None) -> float:
+    """Привести значение к float; ``None`` и пустые значения считаются 0."""
+    return float(value or 0)
+
+
+def _normalized(values: Mapping[str, float]) -> Dict[str, float]:
+    """Вернуть копию словаря со значениями, приведёнными к float."""
+    return {key: _to_amount(value) for key, value in values.items()}
 
 
 def _safe_sum(values: Dict[str, float]) -> float:
-    """Безопасно суммировать значения словаря.
+    """Суммировать значения словаря.
 
-    Пустые словари возвращают 0.0. Неинициализированные (None) значения
-    интерпретируются как 0.
+    Пустые словари возвращают 0.0. Значения должны быть уже приведены к
+    float (см. ``_normalized``), поэтому поэлементное преобразование не
+    выполняется. ``math.fsum`` суммирует без накопления ошибки округления.
     """
-    return sum(float(v or 0) for v in values.values())
+    return math.fsum(values.values())
 
 
-@dataclass
+@dataclass(slots=True)
 class IncomeStatement:
     """Представляет собой доходы и расходы за месяц.
 
@@ -34,43 +51,112 @@ class IncomeStatement:
         Словарь с ключами – категориями доходов, значениями – суммами.
     expenses: Dict[str, float]
         Словарь с ключами – категориями расходов, значениями – суммами.
-    passive_categories: set[str]
-        Множество ключей из ``incomes``, которые считаются пассивными
+    passive_categories: frozenset[str]
+        Неизменяемое множество ключей из ``incomes``, которые считаются пассивными
         доходами.
+
+    Итоговые суммы хранятся в служебных полях. Методы
+    ``set_income``/``set_expense`` пересчитывают через ``math.fsum`` только
+    итоги изменённого словаря (в нём не более десятка категорий), поэтому
+    запрос итогов не требует обхода словарей, а ошибка округления не
+    накапливается. Если словари изменялись напрямую, итоги можно
+    пересчитать методом ``recalculate``.
     """
 
     incomes: Dict[str, float] = field(default_factory=dict)
     expenses: Dict[str, float] = field(default_factory=dict)
-    passive_categories: set[str] = field(default_factory=lambda: {
+    passive_categories: frozenset[str] = frozenset({
         'interest_dividends',
         'real_estate_income',
         'business_income',
         'other_passive_income',
     })
+    _total_incomes: float = field(default=0.0, init=False, repr=False)
+    _total_expenses: float = field(default=0.0, init=False, repr=False)
+    _passive_income: float = field(default=0.0, init=False, repr=False)
+    _cash_flow: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.passive_categories = frozenset(self.passive_categories)
+        self.recalculate()
+
+    def recalculate(self) -> None:
+        """Полностью пересчитать итоговые суммы по содержимому словарей.
+
+        Словари заменяются копиями со значениями, приведёнными к float;
+        переданные в конструктор словари не изменяются.
+        """
+        self.incomes = _normalized(self.incomes)
+        self.expenses = _normalized(self.expenses)
+        self._total_incomes = _safe_sum(self.incomes)
+        self._total_expenses = _safe_sum(self.expenses)
+        self._passive_income = self._sum_passive()
+        self._cash_flow = self._total_incomes - self._total_expenses
+
+    def _sum_passive(self) -> float:
+        # Обходим только те пассивные категории, которые действительно заполнены
+        return math.fsum(
+            self.incomes[key] for key in self.passive_categories & self.incomes.keys()
+        )
+
+    def _update_income_totals(self, passive_changed: bool) -> None:
+        self._total_incomes = _safe_sum(self.incomes)
+        self._cash_flow = self._total_incomes - self._total_expenses
+        if passive_changed:
+            self._passive_income = self._sum_passive()
+
+    def _update_expense_totals(self) -> None:
+        self._total_expenses = _safe_sum(self.expenses)
+        self._cash_flow = self._total_incomes - self._total_expenses
+
+    def set_income(self, category: str, value: float) -> None:
+        """Установить доход по категории и пересчитать итоги доходов."""
+        self.incomes[category] = _to_amount(value)
+        self._update_income_totals(category in self.passive_categories)
+
+    def set_expense(self, category: str, value: float) -> None:
+        """Установить расход по категории и пересчитать итог расходов."""
+        self.expenses[category] = _to_amount(value)
+        self._update_expense_totals()
+
+    def set_incomes(self, values: Mapping[str, float]) -> None:
+        """Установить доходы по нескольким категориям.
+
+        Все значения приводятся к float до изменения отчёта, а итоги
+        пересчитываются один раз после записи всех значений.
+        """
+        amounts = _normalized(values)
+        self.incomes.update(amounts)
+        self._update_income_totals(not self.passive_categories.isdisjoint(amounts))
+
+    def set_expenses(self, values: Mapping[str, float]) -> None:
+        """Установить расходы по нескольким категориям (см. ``set_incomes``)."""
+        self.expenses.update(_normalized(values))
+        self._update_expense_totals()
 
     def total_income(self) -> float:
         """Вернуть сумму всех доходов."""
-        return _safe_sum(self.incomes)
+        return self._total_incomes
 
     def total_expenses(self) -> float:
         """Вернуть сумму всех расходов."""
-        return _safe_sum(self.expenses)
+        return self._total_expenses
 
     def passive_income(self) -> float:
-        """Вычислить сумму пассивных доходов.
+        """Вернуть сумму пассивных доходов.
 
         Пассивные доходы определяются согласно множеству
         ``passive_categories``. Отсутствующие категории считаются равными нулю.
         """
-        return sum(float(self.incomes.get(key, 0) or 0) for key in self.passive_categories)
+        return self._passive_income
 
     def cash_flow(self) -> float:
-        """Вычислить денежный поток (разница между общими доходами и
+        """Вернуть денежный поток (разница между общими доходами и
         общими расходами)."""
-        return self.total_income() - self.total_expenses()
+        return self._cash_flow
 
 
-@dataclass
+@dataclass(slots=True)
 class BalanceSheet:
     """Представляет собой список активов и обязательств.
 
@@ -80,32 +166,91 @@ class BalanceSheet:
         Категории активов (сбережения, недвижимость и т. д.).
     liabilities: Dict[str, float]
         Категории обязательств (ипотека, кредиты и т. д.).
+
+    Как и в ``IncomeStatement``, методы ``set_asset``/``set_liability``
+    пересчитывают итог только изменённого словаря.
     """
 
     assets: Dict[str, float] = field(default_factory=dict)
     liabilities: Dict[str, float] = field(default_factory=dict)
+    _total_assets: float = field(default=0.0, init=False, repr=False)
+    _total_liabilities: float = field(default=0.0, init=False, repr=False)
+    _net_worth: float = field(default=0.0, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self.recalculate()
+
+    def recalculate(self) -> None:
+        """Полностью пересчитать итоговые суммы по содержимому словарей.
+
+        Словари заменяются копиями со значениями, приведёнными к float;
+        переданные в конструктор словари не изменяются.
+        """
+        self.assets = _normalized(self.assets)
+        self.liabilities = _normalized(self.liabilities)
+        self._total_assets = _safe_sum(self.assets)
+        self._total_liabilities = _safe_sum(self.liabilities)
+        self._net_worth = self._total_assets - self._total_liabilities
+
+    def _update_asset_totals(self) -> None:
+        self._total_assets = _safe_sum(self.assets)
+        self._net_worth = self._total_assets - self._total_liabilities
+
+    def _update_liability_totals(self) -> None:
+        self._total_liabilities = _safe_sum(self.liabilities)
+        self._net_worth = self._total_assets - self._total_liabilities
+
+    def set_asset(self, category: str, value: float) -> None:
+        """Установить актив по категории и пересчитать итог активов."""
+        self.assets[category] = _to_amount(value)
+        self._update_asset_totals()
+
+    def set_liability(self, category: str, value: float) -> None:
+        """Установить обязательство по категории и пересчитать итог обязательств."""
+        self.liabilities[category] = _to_amount(value)
+        self._update_liability_totals()
+
+    def set_assets(self, values: Mapping[str, float]) -> None:
+        """Установить активы по нескольким категориям.
+
+        Все значения приводятся к float до изменения отчёта, а итог
+        пересчитывается один раз после записи всех значений.
+        """
+        self.assets.update(_normalized(values))
+        self._update_asset_totals()
+
+    def set_liabilities(self, values: Mapping[str, float]) -> None:
+        """Установить обязательства по нескольким категориям (см. ``set_assets``)."""
+        self.liabilities.update(_normalized(values))
+        self._update_liability_totals()
 
     def total_assets(self) -> float:
         """Вернуть сумму всех активов."""
-        return _safe_sum(self.assets)
+        return self._total_assets
 
     def total_liabilities(self) -> float:
         """Вернуть сумму всех обязательств."""
-        return _safe_sum(self.liabilities)
+        return self._total_liabilities
 
     def net_worth(self) -> float:
-        """Вычислить чистые активы (разница между активами и
+        """Вернуть чистые активы (разница между активами и
         обязательствами)."""
-        return self.total_assets() - self.total_liabilities()
+        return self._net_worth
 
 
-@dataclass
+@dataclass(slots=True)
 class FinancialStatement:
     """Комплексный финансовый отчёт.
 
     Содержит ``IncomeStatement`` и ``BalanceSheet`` и объединяет
     вычисления по ним. Это полезно для GUI, где требуется доступ к
     обоим типам отчётов из одного объекта.
+
+    Итоговые показатели (``total_income``, ``cash_flow``, ``net_worth`` и
+    т. д.) – свойства только для чтения. Они возвращают итоги, уже
+    вычисленные вложенными отчётами, поэтому всегда согласованы с ними,
+    в том числе при изменении ``income_statement``/``balance_sheet``
+    напрямую.
     """
 
     income_statement: IncomeStatement = field(default_factory=IncomeStatement)
@@ -113,19 +258,43 @@ class FinancialStatement:
 
     def update_income(self, category: str, value: float) -> None:
         """Обновить значение дохода для указанной категории."""
-        self.income_statement.incomes[category] = value
+        self.income_statement.set_income(category, value)
 
     def update_expense(self, category: str, value: float) -> None:
         """Обновить значение расхода для указанной категории."""
-        self.income_statement.expenses[category] = value
+        self.income_statement.set_expense(category, value)
 
     def update_asset(self, category: str, value: float) -> None:
         """Обновить значение актива для указанной категории."""
-        self.balance_sheet.assets[category] = value
+        self.balance_sheet.set_asset(category, value)
 
     def update_liability(self, category: str, value: float) -> None:
         """Обновить значение обязательства для указанной категории."""
-        self.balance_sheet.liabilities[category] = value
+        self.balance_sheet.set_liability(category, value)
+
+    def update_bulk(self, section: str, values: Mapping[str, float]) -> None:
+        """Обновить сразу несколько категорий одного раздела.
+
+        ``section`` – один из разделов ``'income'``, ``'expense'``,
+        ``'asset'`` или ``'liability'``. Все значения записываются за один
+        проход по ``values``, а итоги раздела пересчитываются один раз в
+        конце; это удобно при загрузке всего отчёта целиком.
+
+        Все значения приводятся к float до изменения отчёта: если хотя бы
+        одно из них некорректно, возникает ``ValueError`` и отчёт остаётся
+        прежним.
+        """
+        setters = {
+            'income': self.income_statement.set_incomes,
+            'expense': self.income_statement.set_expenses,
+            'asset': self.balance_sheet.set_assets,
+            'liability': self.balance_sheet.set_liabilities,
+        }
+        try:
+            setter = setters[section]
+        except KeyError:
+            raise ValueError(f"Неизвестный раздел отчёта: {section!r}") from None
+        setter(values)
 
     @property
     def total_income(self) -> float:
@@ -153,4 +322,4 @@ class FinancialStatement:
 
     @property
     def net_worth(self) -> float:
-        return self.balance_sheet.net_worth()
\ No newline at end of file
+        return self.balance_sheet.net_worth()
@@ -0,0 +1,59 @@
+"""
+Тесты для вспомогательных функций ``cashflow_app.app``.
+
+Проверяются только функции уровня модуля: проверка ввода, разбор
+значений и форматирование сумм. Для них не требуется создавать окно
+Tkinter, поэтому тесты запускаются и без графического окружения.
+"""
+
+import unittest
+
+from cashflow_app.app import _NUMERIC_INPUT, _format_money, _parse_value_cached
+
+
+class TestNumericInput(unittest.TestCase):
+    def test_accepts_numbers(self) -> None:
+        for text in ('0', '100', '-250', '1.5', '1,5', '12.', ',5'):
+            with self.subTest(text=text):
+                self.assertIsNotNone(_NUMERIC_INPUT.fullmatch(text))
+
+    def test_accepts_partial_input(self) -> None:
+        for text in ('', '-', ',', '.', '-,', '-,5'):
+            with self.subTest(text=text):
+                self.assertIsNotNone(_NUMERIC_INPUT.fullmatch(text))
+
+    def test_rejects_non_numeric_input(self) -> None:
+        for text in ('1e3', 'nan', 'inf', '1.5.', '1,5,', '--1', '1-', 'abc', ' 1'):
+            with self.subTest(text=text):
+                self.assertIsNone(_NUMERIC_INPUT.fullmatch(text))
+
+
+class TestParseValue(unittest.TestCase):
+    def test_parses_numbers(self) -> None:
+        self.assertEqual(_parse_value_cached('100'), 100.0)
+        self.assertEqual(_parse_value_cached('1,5'), 1.5)
+        self.assertEqual(_parse_value_cached('-,5'), -0.5)
+
+    def test_partial_input_is_zero(self) -> None:
+        for text in ('', '-', ',', '-,'):
+            with self.subTest(text=text):
+                self.assertEqual(_parse_value_cached(text), 0.0)
+
+
+class TestFormatMoney(unittest.TestCase):
+    def test_matches_replace_based_format(self) -> None:
+        # Прежняя реализация форматирования через две замены
+        def reference(number: float) -> str:
+            return f"{number:,.2f}".replace(',', ' ').replace('.', ',')
+
+        for number in (0.0, 5.5, -5.5, 1234.5, -1234567.891, 1e12, -9.87654321e15):
+            with self.subTest(number=number):
+                self.assertEqual(_format_money(number), reference(number))
+
+    def test_examples(self) -> None:
+        self.assertEqual(_format_money(0.0), '0,00')
+        self.assertEqual(_format_money(-1234567.891), '-1 234 567,89')
+
+
+if __name__ == '__main__':
+    unittest.main()
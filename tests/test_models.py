@@ -8,7 +8,9 @@
 """
 
 import unittest
+from unittest import mock
 
+from cashflow_app import models
 from cashflow_app.models import IncomeStatement, BalanceSheet, FinancialStatement
 
 
@@ -53,6 +55,24 @@ class TestIncomeStatement(unittest.TestCase):
         expected_cash_flow = expected_income - expected_expenses
         self.assertAlmostEqual(self.statement.cash_flow(), expected_cash_flow)
 
+    def test_input_dicts_are_not_modified(self) -> None:
+        incomes = {'salary': 3000, 'business_income': None}
+        statement = IncomeStatement(incomes=incomes)
+        self.assertEqual(incomes, {'salary': 3000, 'business_income': None})
+        self.assertIsInstance(incomes['salary'], int)
+        statement.set_income('salary', 100)
+        self.assertEqual(incomes['salary'], 3000)
+
+    def test_custom_passive_categories(self) -> None:
+        statement = IncomeStatement(
+            incomes={'salary': 1000, 'royalties': 300},
+            passive_categories={'royalties', 'interest_dividends'},
+        )
+        self.assertIsInstance(statement.passive_categories, frozenset)
+        self.assertAlmostEqual(statement.passive_income(), 300)
+        statement.set_income('interest_dividends', 50)
+        self.assertAlmostEqual(statement.passive_income(), 350)
+
 
 class TestBalanceSheet(unittest.TestCase):
     def setUp(self) -> None:
@@ -117,6 +137,128 @@ class TestFinancialStatement(unittest.TestCase):
         self.assertAlmostEqual(fs.total_liabilities, 50000)
         self.assertAlmostEqual(fs.net_worth, 10000 - 50000)
 
+    def test_repeated_updates_replace_previous_value(self) -> None:
+        fs = FinancialStatement()
+        # Повторная запись в ту же категорию заменяет значение, а не суммирует
+        fs.update_income('salary', 1000)
+        fs.update_income('salary', 2500)
+        fs.update_income('real_estate_income', 300)
+        fs.update_income('real_estate_income', 200)
+        fs.update_expense('taxes', 400)
+        fs.update_expense('taxes', 0)
+        fs.update_asset('savings', 700)
+        fs.update_asset('savings', 900)
+        fs.update_liability('car_loan', 300)
+        fs.update_liability('car_loan', 100)
+
+        self.assertAlmostEqual(fs.total_income, 2700)
+        self.assertAlmostEqual(fs.passive_income, 200)
+        self.assertAlmostEqual(fs.total_expenses, 0)
+        self.assertAlmostEqual(fs.cash_flow, 2700)
+        self.assertAlmostEqual(fs.total_assets, 900)
+        self.assertAlmostEqual(fs.total_liabilities, 100)
+        self.assertAlmostEqual(fs.net_worth, 800)
+
+    def test_large_value_does_not_corrupt_totals(self) -> None:
+        fs = FinancialStatement()
+        fs.update_income('salary', 1e20)
+        fs.update_income('interest_dividends', 1500)
+        fs.update_income('salary', 0)
+        self.assertEqual(fs.total_income, 1500)
+        self.assertEqual(fs.passive_income, 1500)
+
+    def test_totals_return_to_exact_zero(self) -> None:
+        fs = FinancialStatement()
+        fs.update_income('salary', 0.7)
+        fs.update_income('interest_dividends', 0.1)
+        fs.update_income('salary', 0)
+        fs.update_income('interest_dividends', 0)
+        fs.update_asset('gold', 0.7)
+        fs.update_asset('stocks', 0.1)
+        fs.update_asset('gold', 0)
+        fs.update_asset('stocks', 0)
+        self.assertEqual(fs.total_income, 0.0)
+        self.assertEqual(fs.passive_income, 0.0)
+        self.assertEqual(fs.total_assets, 0.0)
+        self.assertEqual(fs.cash_flow, fs.total_income - fs.total_expenses)
+        self.assertEqual(fs.net_worth, fs.total_assets - fs.total_liabilities)
+        self.assertEqual(fs.cash_flow, 0.0)
+        self.assertEqual(fs.net_worth, 0.0)
+
+    def test_empty_values_are_treated_as_zero(self) -> None:
+        fs = FinancialStatement(
+            income_statement=IncomeStatement(incomes={'salary': None, 'business_income': 100}),
+        )
+        self.assertEqual(fs.income_statement.incomes['salary'], 0.0)
+        self.assertAlmostEqual(fs.total_income, 100)
+        fs.update_income('business_income', None)
+        fs.update_expense('taxes', 0)
+        self.assertIsInstance(fs.income_statement.incomes['business_income'], float)
+        self.assertIsInstance(fs.income_statement.expenses['taxes'], float)
+        self.assertEqual(fs.total_income, 0)
+        self.assertEqual(fs.passive_income, 0)
+
+    def test_update_bulk(self) -> None:
+        fs = FinancialStatement()
+        fs.update_income('salary', 1000)
+        fs.update_bulk('income', {'salary': 3000, 'interest_dividends': 200})
+        fs.update_bulk('expense', {'taxes': 400, 'mortgage': 800})
+        fs.update_bulk('asset', {'savings': 5000})
+        fs.update_bulk('liability', {'car_loan': 3000, 'bank_loan': 1000})
+
+        self.assertAlmostEqual(fs.total_income, 3200)
+        self.assertAlmostEqual(fs.passive_income, 200)
+        self.assertAlmostEqual(fs.total_expenses, 1200)
+        self.assertAlmostEqual(fs.cash_flow, 2000)
+        self.assertAlmostEqual(fs.net_worth, 1000)
+
+    def test_totals_follow_direct_changes_to_nested_statements(self) -> None:
+        fs = FinancialStatement()
+        fs.balance_sheet.set_asset('gold', 700)
+        fs.income_statement.set_income('salary', 1500)
+        self.assertAlmostEqual(fs.total_assets, 700)
+        self.assertAlmostEqual(fs.net_worth, 700)
+        self.assertAlmostEqual(fs.total_income, 1500)
+        self.assertAlmostEqual(fs.cash_flow, 1500)
+
+    def test_totals_are_read_only(self) -> None:
+        fs = FinancialStatement()
+        with self.assertRaises(AttributeError):
+            fs.total_income = 5
+
+    def test_update_bulk_unknown_section(self) -> None:
+        fs = FinancialStatement()
+        with self.assertRaises(ValueError):
+            fs.update_bulk('savings', {'savings': 100})
+
+    def test_update_bulk_invalid_value_leaves_statement_unchanged(self) -> None:
+        fs = FinancialStatement()
+        fs.update_income('salary', 50)
+        with self.assertRaises(ValueError):
+            fs.update_bulk('income', {'salary': 100, 'business_income': 'abc'})
+        self.assertEqual(fs.income_statement.incomes, {'salary': 50.0})
+        self.assertAlmostEqual(fs.total_income, 50)
+        self.assertAlmostEqual(fs.income_statement.total_income(), 50)
+
+    def test_update_bulk_recalculates_totals_once(self) -> None:
+        fs = FinancialStatement()
+        expenses = {
+            'taxes': 400, 'mortgage': 800, 'school_loan_payment': 100,
+            'car_payment': 150, 'credit_card_payment': 50, 'retail_payment': 50,
+            'per_child_expense': 0, 'other_expenses': 300, 'bank_loan_payment': 100,
+        }
+        with mock.patch('cashflow_app.models._safe_sum', wraps=models._safe_sum) as safe_sum:
+            fs.update_bulk('expense', expenses)
+        self.assertEqual(safe_sum.call_count, 1)
+        self.assertAlmostEqual(fs.total_expenses, 1950)
+        self.assertAlmostEqual(fs.cash_flow, -1950)
+
+        with mock.patch('cashflow_app.models._safe_sum', wraps=models._safe_sum) as safe_sum:
+            fs.update_bulk('income', {'salary': 3000, 'interest_dividends': 200})
+        self.assertEqual(safe_sum.call_count, 1)
+        self.assertAlmostEqual(fs.passive_income, 200)
+        self.assertAlmostEqual(fs.cash_flow, 3200 - 1950)
+
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file